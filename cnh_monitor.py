@@ -1,325 +1,274 @@
-import streamlit as st
-import yfinance as yf
-import pandas as pd
-import requests
-import time
-from datetime import datetime
-import json
-import random
-import re 
-
-# --- 設定頁面 ---
-st.set_page_config(
-    page_title="CNH 爆貶戰情監控室",
-    page_icon="🇨🇳",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# --- 數據抓取模組 ---
-
-@st.cache_data(ttl=60)
-def get_yahoo_data():
-    """從 Yahoo Finance 獲取基礎匯率與金價"""
-    tickers = ["CNY=X", "CNH=X", "HKD=X", "GC=F"]
-    try:
-        # 增加 timeout 防止卡死
-        data = yf.download(tickers, period="5d", interval="5m", progress=False, timeout=10)
-        result = {}
-        df_close = data['Close']
-        for t in tickers:
-            try:
-                if t in df_close.columns:
-                    last_valid = df_close[t].dropna().iloc[-1]
-                    result[t] = float(last_valid)
-                else:
-                    col_name = [c for c in df_close.columns if t.replace('=X','') in c]
-                    if col_name:
-                         last_valid = df_close[col_name[0]].dropna().iloc[-1]
-                         result[t] = float(last_valid)
-            except Exception as e:
-                result[t] = None
-
-        final_data = {
-            'cny': result.get("CNY=X"),
-            'cnh': result.get("CNH=X"),
-            'hkd': result.get("HKD=X"),
-            'gold_intl': result.get("GC=F")
-        }
-        if None in final_data.values():
-            return None
-        return final_data
-    except Exception as e:
-        # st.error(f"Yahoo Finance 數據獲取失敗: {e}")
-        return None
-
-def get_shanghai_gold():
-    """
-    爬取上海金價 (三層備援策略)
-    """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Referer": "https://finance.sina.com.cn/"
-    }
-    
-    # --- Source 1: 新浪財經 API (Sina) ---
-    try:
-        url_sina = "https://hq.sinajs.cn/list=gds_Au99_99"
-        resp = requests.get(url_sina, headers=headers, timeout=2)
-        if resp.status_code == 200 and '="' in resp.text:
-            data_str = resp.text.split('="')[1].split('"')[0]
-            data_parts = data_str.split(',')
-            price = float(data_parts[0])
-            if price == 0 and len(data_parts) > 7: price = float(data_parts[7])
-            if price > 0: return price
-    except Exception:
-        pass
-
-    # --- Source 2: 騰訊財經 API (Tencent) ---
-    try:
-        url_tencent = "https://qt.gtimg.cn/q=SGE_AU9999"
-        resp = requests.get(url_tencent, headers=headers, timeout=2)
-        if resp.status_code == 200 and '="' in resp.text:
-            data_str = resp.text.split('="')[1].split('"')[0]
-            data_parts = data_str.split('~')
-            if len(data_parts) > 3:
-                price = float(data_parts[3])
-                if price > 0: return price
-    except Exception:
-        pass
-
-    # --- Source 3: 東方財富 API (Eastmoney) ---
-    try:
-        url_east = "https://push2.eastmoney.com/api/qt/stock/get?secid=113.Au99.99&fields=f43"
-        resp = requests.get(url_east, headers=headers, timeout=3)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data and data.get("data"):
-                price = data["data"].get("f43")
-                if price != "-":
-                    return float(price)
-    except Exception:
-        pass
-
-    return None
-
-def get_binance_usdt_cny():
-    """
-    嘗試從幣安 P2P API 獲取 USDT/CNY 買單價格
-    """
-    url = "https://p2p.binance.com/bapi/c2c/v2/friendly/c2c/adv/search"
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
-    payload = {
-        "page": 1, "rows": 5,
-        "payTypes": [], "asset": "USDT", "tradeType": "BUY",
-        "fiat": "CNY", "publisherType": None
-    }
-    try:
-        response = requests.post(url, json=payload, headers=headers, timeout=3)
-        if response.status_code == 200:
-            data = response.json()
-            if data['data']:
-                price = float(data['data'][0]['adv']['price'])
-                return price
-    except Exception as e:
-        pass
-    return None
-
-# --- 核心邏輯 ---
-
-def calculate_metrics(yahoo_data, sh_gold, usdt_cny):
-    if not yahoo_data:
-        return None
-
-    cny = yahoo_data['cny']
-    cnh = yahoo_data['cnh']
-    hkd = yahoo_data['hkd']
-    gold_intl_usd = yahoo_data['gold_intl']
-
-    # 1. 價差
-    spread = (cnh - cny) * 10000 if cnh and cny else 0
-
-    # 2. 黃金溢價
-    gold_premium = 0
-    gold_intl_cny_g = 0
-    if gold_intl_usd and cny:
-        # 換算公式: 國際金價(USD/oz) / 31.1035 * 匯率(CNY) = 國際金價(CNY/g)
-        gold_intl_cny_g = (gold_intl_usd / 31.1035) * cny
-        
-        if sh_gold:
-            # 溢價(USD/oz) = (上海金價(CNY/g) - 國際金價(CNY/g)) / 匯率 * 31.1035
-            # 計算每克的人民幣價差
-            diff_per_gram_cny = sh_gold - gold_intl_cny_g
-            # 換算回每盎司美元
-            gold_premium = (diff_per_gram_cny / cny) * 31.1035
-
-    # 3. USDT 溢價
-    usdt_premium_pct = 0
-    if usdt_cny and cnh:
-        usdt_premium_pct = ((usdt_cny - cnh) / cnh) * 100
-
-    return {
-        "cny": cny,
-        "cnh": cnh,
-        "hkd": hkd,
-        "spread": spread,
-        "gold_intl_usd": gold_intl_usd,
-        "sh_gold": sh_gold,
-        "gold_premium": gold_premium,
-        "usdt_cny": usdt_cny,
-        "usdt_premium": usdt_premium_pct,
-        "timestamp": datetime.now()
-    }
-
-def analyze_risk(metrics, hibor_val):
-    risk_report = {"level": "normal", "msg": "目前指標平穩，維持觀望。", "color": "green"}
-    if not metrics: return risk_report
-
-    is_spread_high = metrics['spread'] > 500
-    is_spread_critical = metrics['spread'] > 1000
-    is_cnh_breakout = metrics['cnh'] > 7.35
-    is_capital_flight = metrics['gold_premium'] > 30 or metrics['usdt_premium'] > 2.0
-    is_hibor_squeeze = hibor_val is not None and hibor_val > 10
-
-    if is_hibor_squeeze:
-        risk_report = {"level": "critical", "msg": "⚠️ 緊急撤退 (Emergency Exit)：流動性夾殺中", "color": "purple"}
-    elif is_cnh_breakout and is_spread_critical:
-        risk_report = {"level": "critical", "msg": "🔥 全力行動 (Full Action)：防線潰決", "color": "red"}
-    elif is_spread_high or is_capital_flight:
-        risk_report = {"level": "warning", "msg": "🛡️ 高度警戒 (High Alert)：資金外逃跡象", "color": "orange"}
-    return risk_report
-
-# --- UI 渲染 ---
-
-def main():
-    st.title("🇨🇳 CNH 爆貶戰情監控室 (Python Live Ver.)")
-    st.markdown("數據來源：Yahoo Finance, (API) 新浪/騰訊/東方財富, Binance P2P")
-    
-    # --- 側邊欄手動輸入區 ---
-    with st.sidebar:
-        st.header("🔧 手動數據輸入")
-        st.caption("若 API 抓取失敗，請在此輸入數據以啟用計算。")
-        
-        manual_sh_gold = st.number_input(
-            "上海金價 (Au99.99, CNY/g)", 
-            min_value=0.0, 
-            value=0.0, 
-            step=0.1, 
-            format="%.2f",
-            help="輸入人民幣/克，例如 620.50"
-        )
-        
-        manual_hibor = st.number_input(
-            "CNH HIBOR (%)", 
-            min_value=0.0, 
-            value=0.0, 
-            step=0.1, 
-            format="%.2f",
-            help="離岸人民幣隔夜拆息"
-        )
-        
-        st.markdown("---")
-        if st.button('🔄 立即更新數據'):
-            st.cache_data.clear()
-            st.rerun()
-
-    # --- 數據獲取 ---
-    with st.spinner('正在掃描全球市場...'):
-        yahoo_data = get_yahoo_data()
-        sh_gold_scraped = get_shanghai_gold()
-        usdt_cny = get_binance_usdt_cny()
-        
-        # --- 黃金價格邏輯：手動 > 爬蟲 ---
-        if manual_sh_gold > 0:
-            final_sh_gold = manual_sh_gold
-            gold_source = "(手動)"
-        else:
-            final_sh_gold = sh_gold_scraped
-            gold_source = "(API)"
-            
-        # --- HIBOR 邏輯：手動 > 預設 ---
-        if manual_hibor > 0:
-            hibor_val = manual_hibor
-            hibor_display = f"{manual_hibor}% (手動)"
-        else:
-            hibor_val = 2.5 # 預設值
-            hibor_display = "N/A (API 無數據)"
-
-    if not yahoo_data:
-        st.error("Yahoo Finance 連線失敗")
-        if not final_sh_gold:
-             return
-
-    metrics = calculate_metrics(yahoo_data, final_sh_gold, usdt_cny)
-    risk = analyze_risk(metrics, hibor_val)
-
-    st.markdown("---")
-    st.subheader(f"戰略建議：{risk['msg']}")
-    if risk['color'] == "red": st.error(risk['msg'])
-    elif risk['color'] == "orange": st.warning(risk['msg'])
-    else: st.success(risk['msg'])
-    st.markdown("---")
-
-    col1, col2, col3 = st.columns(3)
-
-    # 1. 潛伏期
-    with col1:
-        st.markdown("### 1. 潛伏期")
-        premium_val = metrics['gold_premium']
-        
-        st.metric(
-            label="上海金價溢價 (USD/oz)",
-            value=f"${premium_val:.2f}" if final_sh_gold and yahoo_data else "N/A",
-            delta="警戒 > $30",
-            delta_color="inverse" if premium_val > 30 else "normal"
-        )
-        
-        if final_sh_gold:
-            st.caption(f"上海金: ¥{final_sh_gold:.2f}/g {gold_source}")
-            if yahoo_data:
-                intl_g = (metrics['gold_intl_usd']/31.1035*metrics['cny'])
-                st.caption(f"國際折算: ¥{intl_g:.2f}/g")
-        else:
-            st.warning("⚠️ 無法獲取上海金價，請在側邊欄手動輸入")
-
-        usdt_p = metrics['usdt_premium']
-        st.metric(
-            label="USDT 溢價",
-            value=f"{usdt_p:.2f}%" if usdt_cny and yahoo_data else "N/A",
-            delta="警戒 > 2%",
-            delta_color="inverse" if usdt_p > 2 else "normal"
-        )
-        if yahoo_data:
-             st.metric(label="港幣 (HKD)", value=f"{metrics['hkd']:.4f}", delta="弱方 7.85", delta_color="inverse" if metrics['hkd'] > 7.84 else "off")
-
-    # 2. 防守期
-    with col2:
-        st.markdown("### 2. 防守期")
-        if yahoo_data:
-            st.metric(label="離岸人民幣 (CNH)", value=f"{metrics['cnh']:.4f}", delta="關鍵 7.35", delta_color="inverse" if metrics['cnh'] > 7.30 else "normal")
-            spr = metrics['spread']
-            st.metric(label="價差 (Spread)", value=f"{spr:.0f} pips", delta="警戒 > 500", delta_color="inverse" if spr > 500 else "normal")
-        st.metric(label="HIBOR O/N", value=hibor_display, delta="警戒 > 5%", help="需手動查詢")
-
-    # 3. 操作期
-    with col3:
-        st.markdown("### 3. 操作期")
-        check_1 = metrics['cnh'] > 7.30 if metrics else False
-        check_2 = metrics['spread'] > 500 if metrics else False
-        check_3 = metrics['gold_premium'] > 30 if metrics else False
-        
-        st.checkbox("CNH > 7.30", value=check_1, disabled=True)
-        st.checkbox("Spread > 500", value=check_2, disabled=True)
-        st.checkbox("資金外逃跡象", value=check_3, disabled=True)
-        if check_1 and check_2: st.error("🚨 趨勢確立")
-        else: st.info("✋ 觀望中")
-
-    st.markdown("---")
-    if metrics:
-        st.caption(f"更新時間: {metrics['timestamp'].strftime('%H:%M:%S')}")
-
-if __name__ == "__main__":
-    main()
+import functools
+import time
+
+import streamlit as st
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from scrapers import get_yahoo_data, get_shanghai_gold, get_binance_usdt_cny
+
+# --- 設定頁面 ---
+st.set_page_config(
+    page_title="CNH 爆貶戰情監控室",
+    page_icon="🇨🇳",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# 金衡盎司換算常數 (Streamlit 每次互動都重跑腳本，常數一律放模組層)
+_GRAMS_PER_OZ = 31.1035
+_OZ_PER_GRAM = 1.0 / _GRAMS_PER_OZ
+
+# --- 核心邏輯 ---
+
+def _round6(value):
+    """lru_cache 的 key 取到小數第 6 位，None 原樣放行"""
+    return round(value, 6) if value is not None else None
+
+@functools.lru_cache(maxsize=128)
+def _calculate_metrics_cached(cny, cnh, gold_intl_usd, sh_gold, usdt_cny):
+    # 1. 價差
+    spread = (cnh - cny) * 10000 if cnh and cny else 0
+
+    # 2. 黃金溢價
+    gold_premium = 0
+    gold_intl_cny_g = 0
+    if gold_intl_usd and cny:
+        # 換算公式: 國際金價(USD/oz) / 31.1035 * 匯率(CNY) = 國際金價(CNY/g)
+        gold_intl_cny_g = gold_intl_usd * _OZ_PER_GRAM * cny
+
+        if sh_gold:
+            # 溢價(USD/oz) = (上海金價(CNY/g) - 國際金價(CNY/g)) / 匯率 * 31.1035
+            # 計算每克的人民幣價差
+            diff_per_gram_cny = sh_gold - gold_intl_cny_g
+            # 換算回每盎司美元
+            gold_premium = (diff_per_gram_cny / cny) * _GRAMS_PER_OZ
+
+    # 3. USDT 溢價
+    usdt_premium_pct = 0
+    if usdt_cny and cnh:
+        usdt_premium_pct = ((usdt_cny - cnh) / cnh) * 100
+
+    return (spread, gold_premium, usdt_premium_pct)
+
+def calculate_metrics(yahoo_data, sh_gold, usdt_cny):
+    if not yahoo_data:
+        return None
+
+    cny = yahoo_data['cny']
+    cnh = yahoo_data['cnh']
+    hkd = yahoo_data['hkd']
+    gold_intl_usd = yahoo_data['gold_intl']
+
+    # 算術部分走 lru_cache：輸入沒變的 rerun (側邊欄亂點) 直接查表
+    # 時間戳不進 key，回傳時才蓋上去
+    spread, gold_premium, usdt_premium_pct = _calculate_metrics_cached(
+        _round6(cny), _round6(cnh), _round6(gold_intl_usd),
+        _round6(sh_gold), _round6(usdt_cny)
+    )
+
+    return {
+        "cny": cny,
+        "cnh": cnh,
+        "hkd": hkd,
+        "spread": spread,
+        "gold_intl_usd": gold_intl_usd,
+        "sh_gold": sh_gold,
+        "gold_premium": gold_premium,
+        "usdt_cny": usdt_cny,
+        "usdt_premium": usdt_premium_pct
+    }
+
+@functools.lru_cache(maxsize=256)
+def _analyze_risk_cached(cnh, spread, gold_premium, usdt_premium, hibor_squeeze):
+    is_spread_high = spread > 500
+    is_spread_critical = spread > 1000
+    is_cnh_breakout = cnh > 7.35
+    is_capital_flight = gold_premium > 30 or usdt_premium > 2.0
+
+    if hibor_squeeze:
+        return ("critical", "⚠️ 緊急撤退 (Emergency Exit)：流動性夾殺中", "purple")
+    if is_cnh_breakout and is_spread_critical:
+        return ("critical", "🔥 全力行動 (Full Action)：防線潰決", "red")
+    if is_spread_high or is_capital_flight:
+        return ("warning", "🛡️ 高度警戒 (High Alert)：資金外逃跡象", "orange")
+    return ("normal", "目前指標平穩，維持觀望。", "green")
+
+def analyze_risk(metrics, hibor_val):
+    if not metrics:
+        return {"level": "normal", "msg": "目前指標平穩，維持觀望。", "color": "green"}
+
+    # 輸入先取整再查 lru_cache：低於判斷門檻的小數波動不會產生新 key
+    level, msg, color = _analyze_risk_cached(
+        round(metrics['cnh'], 4),
+        round(metrics['spread']),
+        round(metrics['gold_premium'], 1),
+        round(metrics['usdt_premium'], 2),
+        hibor_val is not None and hibor_val > 10
+    )
+    return {"level": level, "msg": msg, "color": color}
+
+# --- UI 渲染 ---
+
+@st.fragment
+def render_dashboard():
+    """抓數據 + 畫三欄儀表板。包成 fragment，局部更新時不必重跑整頁"""
+    # 側邊欄輸入透過 session_state 讀取，fragment 單獨重跑時仍拿得到
+    manual_sh_gold = st.session_state.get("manual_sh_gold", 0.0)
+    manual_hibor = st.session_state.get("manual_hibor", 0.0)
+
+    # --- 數據獲取 ---
+    with st.spinner('正在掃描全球市場...'):
+        # 三個數據源互相獨立，並行抓取讓等待時間從「總和」降到「最慢的一個」
+        # 外加 4 秒硬上限：超時的來源直接當 None 顯示 N/A，不讓頁面卡住
+        executor = ThreadPoolExecutor(max_workers=3)
+        future_yahoo = executor.submit(get_yahoo_data)
+        future_gold = executor.submit(get_shanghai_gold)
+        future_usdt = executor.submit(get_binance_usdt_cny)
+        done, not_done = wait([future_yahoo, future_gold, future_usdt], timeout=4.0)
+        for f in not_done:
+            f.cancel()
+        executor.shutdown(wait=False)
+        yahoo_data = future_yahoo.result() if future_yahoo in done else None
+        sh_gold_scraped = future_gold.result() if future_gold in done else None
+        usdt_cny = future_usdt.result() if future_usdt in done else None
+
+        # --- 黃金價格邏輯：手動 > 爬蟲 ---
+        if manual_sh_gold > 0:
+            final_sh_gold = manual_sh_gold
+            gold_source = "(手動)"
+        else:
+            final_sh_gold = sh_gold_scraped
+            gold_source = "(API)"
+            
+        # --- HIBOR 邏輯：手動 > 預設 ---
+        if manual_hibor > 0:
+            hibor_val = manual_hibor
+            hibor_display = f"{manual_hibor}% (手動)"
+        else:
+            hibor_val = 2.5 # 預設值
+            hibor_display = "N/A (API 無數據)"
+
+    if not yahoo_data:
+        st.error("Yahoo Finance 連線失敗")
+        if not final_sh_gold:
+             return
+
+    metrics = calculate_metrics(yahoo_data, final_sh_gold, usdt_cny)
+    risk = analyze_risk(metrics, hibor_val)
+
+    st.markdown("---")
+    st.subheader(f"戰略建議：{risk['msg']}")
+    if risk['color'] == "red": st.error(risk['msg'])
+    elif risk['color'] == "orange": st.warning(risk['msg'])
+    else: st.success(risk['msg'])
+    st.markdown("---")
+
+    # 顯示字串先一次算好，st.metric 只收現成字串，rerun 時 diff 成本最低
+    premium_val = metrics['gold_premium'] if metrics else 0
+    usdt_p = metrics['usdt_premium'] if metrics else 0
+    display = {
+        "gold_premium": f"${premium_val:.2f}" if final_sh_gold and yahoo_data else "N/A",
+        "sh_gold": f"上海金: ¥{final_sh_gold:.2f}/g {gold_source}" if final_sh_gold else "",
+        "intl_gold": (
+            f"國際折算: ¥{metrics['gold_intl_usd'] * _OZ_PER_GRAM * metrics['cny']:.2f}/g"
+            if yahoo_data and metrics else ""
+        ),
+        "usdt_premium": f"{usdt_p:.2f}%" if usdt_cny and yahoo_data else "N/A",
+        "hkd": f"{metrics['hkd']:.4f}" if yahoo_data and metrics else "N/A",
+        "cnh": f"{metrics['cnh']:.4f}" if yahoo_data and metrics else "N/A",
+        "spread": f"{metrics['spread']:.0f} pips" if yahoo_data and metrics else "N/A",
+        "hibor": hibor_display
+    }
+
+    col1, col2, col3 = st.columns(3)
+
+    # 1. 潛伏期
+    with col1:
+        st.markdown("### 1. 潛伏期")
+        st.metric(
+            label="上海金價溢價 (USD/oz)",
+            value=display["gold_premium"],
+            delta="警戒 > $30",
+            delta_color="inverse" if premium_val > 30 else "normal"
+        )
+
+        if final_sh_gold:
+            st.caption(display["sh_gold"])
+            if display["intl_gold"]:
+                st.caption(display["intl_gold"])
+        else:
+            st.warning("⚠️ 無法獲取上海金價，請在側邊欄手動輸入")
+
+        st.metric(
+            label="USDT 溢價",
+            value=display["usdt_premium"],
+            delta="警戒 > 2%",
+            delta_color="inverse" if usdt_p > 2 else "normal"
+        )
+        if yahoo_data:
+             st.metric(label="港幣 (HKD)", value=display["hkd"], delta="弱方 7.85", delta_color="inverse" if metrics['hkd'] > 7.84 else "off")
+
+    # 2. 防守期
+    with col2:
+        st.markdown("### 2. 防守期")
+        if yahoo_data:
+            st.metric(label="離岸人民幣 (CNH)", value=display["cnh"], delta="關鍵 7.35", delta_color="inverse" if metrics['cnh'] > 7.30 else "normal")
+            st.metric(label="價差 (Spread)", value=display["spread"], delta="警戒 > 500", delta_color="inverse" if metrics['spread'] > 500 else "normal")
+        st.metric(label="HIBOR O/N", value=display["hibor"], delta="警戒 > 5%", help="需手動查詢")
+
+    # 3. 操作期
+    with col3:
+        st.markdown("### 3. 操作期")
+        check_1 = metrics['cnh'] > 7.30 if metrics else False
+        check_2 = metrics['spread'] > 500 if metrics else False
+        check_3 = metrics['gold_premium'] > 30 if metrics else False
+        
+        st.checkbox("CNH > 7.30", value=check_1, disabled=True)
+        st.checkbox("Spread > 500", value=check_2, disabled=True)
+        st.checkbox("資金外逃跡象", value=check_3, disabled=True)
+        if check_1 and check_2: st.error("🚨 趨勢確立")
+        else: st.info("✋ 觀望中")
+
+    st.markdown("---")
+    if metrics:
+        # 時鐘跟數值計算分離：時間戳在渲染時蓋一次就好
+        st.caption(f"更新時間: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+def main():
+    st.title("🇨🇳 CNH 爆貶戰情監控室 (Python Live Ver.)")
+    st.markdown("數據來源：Yahoo Finance, (API) 新浪/騰訊/東方財富, Binance P2P")
+
+    # --- 側邊欄手動輸入區 ---
+    with st.sidebar:
+        st.header("🔧 手動數據輸入")
+        st.caption("若 API 抓取失敗，請在此輸入數據以啟用計算。")
+
+        st.number_input(
+            "上海金價 (Au99.99, CNY/g)",
+            min_value=0.0,
+            value=0.0,
+            step=0.1,
+            format="%.2f",
+            help="輸入人民幣/克，例如 620.50",
+            key="manual_sh_gold"
+        )
+
+        st.number_input(
+            "CNH HIBOR (%)",
+            min_value=0.0,
+            value=0.0,
+            step=0.1,
+            format="%.2f",
+            help="離岸人民幣隔夜拆息",
+            key="manual_hibor"
+        )
+
+        st.markdown("---")
+        if st.button('🔄 立即更新數據'):
+            st.cache_data.clear()
+            st.rerun()
+
+    render_dashboard()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import streamlit as st
+import requests
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
+import re
+
+# --- 共用連線設定 ---
+
+# 共用連線池：重複利用 TCP/TLS 連線，省掉每次請求的握手成本
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://finance.sina.com.cn/"
+}
+
+@st.cache_resource
+def _get_session():
+    """連線池放 cache_resource：跨 rerun、跨使用者共用同一組 keep-alive 連線"""
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+    # 暫時性錯誤快速重試 (含 429/5xx)，backoff 很短，總等待仍受 timeout 管束
+    adapter = HTTPAdapter(
+        pool_connections=8, pool_maxsize=32,
+        max_retries=Retry(
+            total=2, connect=2, read=1, backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"]
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Binance P2P 請求內容固定不變，序列化一次就好
+_BINANCE_URL = "https://p2p.binance.com/bapi/c2c/v2/friendly/c2c/adv/search"
+_BINANCE_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+_BINANCE_PAYLOAD_BYTES = json.dumps({
+    "page": 1, "rows": 1,  # 只用得到第一筆廣告，多要只是浪費頻寬
+    "payTypes": [], "asset": "USDT", "tradeType": "BUY",
+    "fiat": "CNY", "publisherType": None
+}).encode()
+# 回應裡第一個 "price" 就是排序第一的廣告價，直接用 regex 撈，免解整包 JSON
+_BINANCE_PRICE_RE = re.compile(rb'"price"\s*:\s*"([0-9.]+)"')
+
+# --- 數據抓取 ---
+
+_YAHOO_TICKERS = ["CNY=X", "CNH=X", "HKD=X", "GC=F"]
+
+def _fetch_yahoo_spark():
+    """spark API：單一請求搞定四個代號的收盤序列"""
+    tickers = _YAHOO_TICKERS
+    url = (
+        "https://query1.finance.yahoo.com/v8/finance/spark"
+        "?symbols=" + ",".join(tickers) + "&range=1d&interval=5m&indicators=close"
+    )
+    try:
+        resp = _get_session().get(url, timeout=(2, 3))
+        if resp.status_code != 200:
+            return None
+        result = {}
+        for sym, payload in resp.json().items():
+            try:
+                closes = payload.get("close") or []
+                # 取最後一筆非空收盤價 (維持原生 float，快取 pickle 才便宜)
+                last = float(next(c for c in reversed(closes) if c is not None))
+                result[sym] = last if last == last else None  # 過濾 NaN
+            except (StopIteration, TypeError, ValueError):
+                result[sym] = None
+
+        final_data = {
+            'cny': result.get("CNY=X"),
+            'cnh': result.get("CNH=X"),
+            'hkd': result.get("HKD=X"),
+            'gold_intl': result.get("GC=F")
+        }
+        if None in final_data.values():
+            return None
+        return final_data
+    except Exception as e:
+        # st.error(f"Yahoo Finance 數據獲取失敗: {e}")
+        return None
+
+def _fetch_yahoo_chart(sym):
+    """chart API 的 meta.regularMarketPrice：spark 失效時的逐代號備援"""
+    try:
+        resp = _get_session().get(
+            "https://query1.finance.yahoo.com/v8/finance/chart/" + sym,
+            params={"interval": "1d", "range": "1d"}, timeout=(2, 3)
+        )
+        if resp.status_code == 200:
+            price = resp.json()["chart"]["result"][0]["meta"]["regularMarketPrice"]
+            if price is not None:
+                return float(price)
+    except Exception:
+        pass
+    return None
+
+@st.cache_data(ttl=30, max_entries=4, show_spinner=False)
+def get_yahoo_data():
+    """從 Yahoo Finance 獲取基礎匯率與金價 (spark 優先，chart API 當備援)"""
+    final_data = _fetch_yahoo_spark()
+    if final_data is not None:
+        return final_data
+
+    # spark 偶爾整包失敗，退回逐代號的 chart API，四個並行抓
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        prices = list(executor.map(_fetch_yahoo_chart, _YAHOO_TICKERS))
+    final_data = dict(zip(('cny', 'cnh', 'hkd', 'gold_intl'), prices))
+    if None in final_data.values():
+        return None
+    return final_data
+
+def _fetch_sina():
+    """新浪財經 API：單行文字報價，最輕量的來源"""
+    try:
+        url_sina = "https://hq.sinajs.cn/list=gds_Au99_99"
+        resp = _get_session().get(url_sina, timeout=(1.5, 1.5))
+        if resp.status_code == 200:
+            # 只需要第 0 欄 (備援第 7 欄)，直接用 bytes.find 掃逗號，
+            # 不 decode、不 split 整行
+            b = resp.content
+            i = b.find(b'"') + 1
+            if i > 0:
+                j = b.find(b',', i)
+                if j != -1:
+                    price = float(b[i:j])
+                    if price == 0:
+                        pos = j
+                        for _ in range(6):
+                            pos = b.find(b',', pos + 1)
+                            if pos == -1:
+                                return None
+                        end = b.find(b',', pos + 1)
+                        price = float(b[pos + 1:end] if end != -1 else b[pos + 1:])
+                    if price > 0: return price
+    except Exception:
+        pass
+    return None
+
+def _fetch_tencent():
+    """騰訊財經 API：~ 分隔的文字報價"""
+    try:
+        url_tencent = "https://qt.gtimg.cn/q=SGE_AU9999"
+        resp = _get_session().get(url_tencent, timeout=(1.5, 1.5))
+        if resp.status_code == 200:
+            # partition 只配置一個 3-tuple；split 上限 4 段，不整行切開
+            _, _, rest = resp.text.partition('="')
+            if rest:
+                data_parts = rest.partition('"')[0].split('~', 4)
+                if len(data_parts) > 3:
+                    price = float(data_parts[3])
+                    if price > 0: return price
+    except Exception:
+        pass
+    return None
+
+def _fetch_east():
+    """東方財富 API：只要 f43 欄位的小型 JSON"""
+    try:
+        url_east = "https://push2.eastmoney.com/api/qt/stock/get?secid=113.Au99.99&fields=f43"
+        resp = _get_session().get(url_east, timeout=(1.5, 1.5))
+        if resp.status_code == 200:
+            data = resp.json()
+            if data and data.get("data"):
+                price = data["data"].get("f43")
+                if price != "-":
+                    return float(price)
+    except Exception:
+        pass
+    return None
+
+@st.cache_data(ttl=300, max_entries=4, persist="disk", show_spinner=False)
+def get_shanghai_gold():
+    """
+    爬取上海金價 (三層備援同時開跑，先回來的有效報價勝出)
+    """
+    # 逐一輪詢最壞要吃滿三段 timeout；改成賽跑後最壞只剩最慢的那一段
+    executor = ThreadPoolExecutor(max_workers=3)
+    futures = [executor.submit(fetch) for fetch in (_fetch_sina, _fetch_tencent, _fetch_east)]
+    price = None
+    try:
+        for future in as_completed(futures, timeout=4.0):
+            price = future.result()
+            if price is not None:
+                break
+    except FutureTimeoutError:
+        pass
+    for f in futures:
+        f.cancel()
+    executor.shutdown(wait=False)
+    return price
+
+@st.cache_data(ttl=60, max_entries=4, persist="disk")
+def get_binance_usdt_cny():
+    """
+    嘗試從幣安 P2P API 獲取 USDT/CNY 買單價格
+    """
+    try:
+        response = _get_session().post(_BINANCE_URL, data=_BINANCE_PAYLOAD_BYTES,
+                                       headers=_BINANCE_HEADERS, timeout=(2, 2))
+        if response.status_code == 200:
+            m = _BINANCE_PRICE_RE.search(response.content)
+            if m:
+                return float(m.group(1))
+    except Exception as e:
+        pass
+    return None